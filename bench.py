@@ -0,0 +1,138 @@
+import sys, json, timeit, platform, argparse, statistics
+from datetime import datetime
+
+import phantom_core as pc
+from loadgen import start_stub_process
+
+# =========================
+# CASES
+# =========================
+KEY_SAMPLE = "PHC-0123456789-ABCDEF0123456789ABCDEF01-2083111039"
+MODULES_ALL = {"system": True, "network": True}
+
+def make_cases(stub_session_url):
+    payload = pc.build_snapshot_payload("PC-BENCH001", MODULES_ALL)
+    # clés de bench en mémoire uniquement ; match_key est le chemin utilisé par App.validate_key
+    pc.ADMIN_KEY_SHA = pc.sha256_hex(KEY_SAMPLE).lower()
+    pc.USER_KEY_SHA = pc.sha256_hex(KEY_SAMPLE + "-user").lower()
+    return {
+        "sign_payload": lambda: pc.sign_payload(pc.SHARED_SECRET, 1760000000, "PC-BENCH001"),
+        "build_snapshot_payload.none": lambda: pc.build_snapshot_payload("PC-BENCH001", {}),
+        "build_snapshot_payload.all": lambda: pc.build_snapshot_payload("PC-BENCH001", MODULES_ALL),
+        "collect_system": pc.collect_system,
+        "collect_network": pc.collect_network,
+        "json_dumps.payload": lambda: json.dumps(payload),
+        "http_post_json.stub": lambda: pc.http_post_json(stub_session_url, payload, timeout=4),
+        "validate_key.sha256": lambda: pc.match_key(KEY_SAMPLE),
+    }
+
+# =========================
+# RUNNER
+# =========================
+def bench_one(fn, repeat=5, min_time=0.2):
+    t = timeit.Timer(fn)
+    number = 1
+    while True:
+        if t.timeit(number) >= min_time:
+            break
+        number *= 2
+    runs = [t.timeit(number) / number * 1e6 for _ in range(repeat)]
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min_us": round(min(runs), 3),
+        "median_us": round(statistics.median(runs), 3),
+        "max_us": round(max(runs), 3),
+    }
+
+def run_all(only=None, repeat=5, min_time=0.2):
+    # stub dans un autre process : http_post_json.stub ne mesure que le client
+    stub, _health, session_url = start_stub_process()
+    try:
+        cases = make_cases(session_url)
+        results = {}
+        for name, fn in cases.items():
+            if only and not any(o in name for o in only):
+                continue
+            results[name] = bench_one(fn, repeat, min_time)
+            print(f"{name:32s} {results[name]['median_us']:>12.3f} us", file=sys.stderr)
+    finally:
+        stub.terminate()
+        stub.wait(5)
+    return {
+        "meta": {
+            "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": f"{platform.system()} {platform.release()} {platform.machine()}",
+        },
+        "results": results,
+    }
+
+def compare(base, cur, threshold):
+    rows, missing = [], []
+    for name, b in base["results"].items():
+        c = cur["results"].get(name)
+        if c is None:
+            missing.append(name)
+            continue
+        ratio = c["median_us"] / b["median_us"] if b["median_us"] else 1.0
+        rows.append({
+            "case": name,
+            "base_us": b["median_us"],
+            "cur_us": c["median_us"],
+            "ratio": round(ratio, 3),
+            "regression": ratio > 1.0 + threshold,
+        })
+    return rows, missing
+
+def load_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def save_json(path, d):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(d, f, indent=2)
+
+# =========================
+# RUN
+# =========================
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Microbenchmarks des chemins non-UI de phantom_core.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    r = sub.add_parser("run", help="mesure et sauvegarde un baseline JSON")
+    r.add_argument("--out", default="bench_baseline.json")
+
+    c = sub.add_parser("compare", help="compare au baseline, exit 1 si régression")
+    c.add_argument("--baseline", default="bench_baseline.json")
+    c.add_argument("--current", default=None, help="résultats déjà mesurés (sinon: nouvelle mesure)")
+    c.add_argument("--threshold", type=float, default=0.15, help="ratio toléré, ex: 0.15 = +15%%")
+    c.add_argument("--out", default=None, help="sauvegarde les résultats courants")
+
+    for p in (r, c):
+        p.add_argument("--only", action="append", default=None, help="filtre sur le nom du cas")
+        p.add_argument("--repeat", type=int, default=5)
+        p.add_argument("--min-time", type=float, default=0.2, help="durée min d'une mesure (s)")
+    a = ap.parse_args(argv)
+
+    if a.cmd == "run":
+        res = run_all(a.only, a.repeat, a.min_time)
+        save_json(a.out, res)
+        print(json.dumps(res, indent=2))
+        return 0
+
+    base = load_json(a.baseline)
+    cur = load_json(a.current) if a.current else run_all(a.only, a.repeat, a.min_time)
+    if a.out:
+        save_json(a.out, cur)
+    rows, missing = compare(base, cur, a.threshold)
+    if a.only:
+        missing = [m for m in missing if any(o in m for o in a.only)]
+    bad = [x for x in rows if x["regression"]]
+    print(json.dumps({"threshold": a.threshold, "cases": rows, "regressions": [x["case"] for x in bad],
+                      "missing": missing}, indent=2))
+    # un cas du baseline absent (renommé / supprimé) compte comme un échec
+    return 1 if bad or missing else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+import os, sys, json, time, math, uuid, threading, argparse, subprocess
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from phantom_core import (
+    ENDPOINT_SESSION, SHARED_SECRET,
+    build_snapshot_payload, sign_payload, http_get_json, http_post_json,
+)
+
+# =========================
+# STUB COLLECTOR (local)
+# =========================
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *_a):
+        pass
+
+    def _reply(self, code, obj):
+        body = json.dumps(obj).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if urlparse(self.path).path == "/health":
+            self._reply(200, {"ok": True})
+        else:
+            self._reply(404, {"ok": False})
+
+    def do_POST(self):
+        n = int(self.headers.get("Content-Length") or 0)
+        try:
+            p = json.loads(self.rfile.read(n).decode("utf-8"))
+            sig = sign_payload(SHARED_SECRET, int(p["timestamp"]), p["session_id"])
+            ok = sig == p.get("signature")
+        except Exception:
+            ok = False
+        self._reply(200 if ok else 403, {"ok": ok})
+
+class StubServer(ThreadingHTTPServer):
+    # backlog listen() large : sinon on mesure la file du stub (resets / SYN retransmit), pas le client
+    request_queue_size = 1024
+    daemon_threads = True
+
+def start_stub(host="127.0.0.1", port=0):
+    srv = StubServer((host, port), StubHandler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv
+
+def stub_urls(srv):
+    host, port = srv.server_address[:2]
+    return f"http://{host}:{port}/health", f"http://{host}:{port}/session"
+
+def start_stub_process():
+    # stub hors process (`loadgen.py --serve`) : ses threads ne faussent pas les mesures côté client
+    proc = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--serve"],
+                            stdout=subprocess.PIPE, text=True)
+    line = proc.stdout.readline()
+    if not line:
+        proc.kill()
+        raise RuntimeError("stub collector n'a pas démarré")
+    urls = json.loads(line)
+    return proc, urls["health"], urls["session"]
+
+# =========================
+# STATS
+# =========================
+def percentile(sorted_vals, q):
+    if not sorted_vals:
+        return 0.0
+    i = min(len(sorted_vals) - 1, max(0, math.ceil(q / 100.0 * len(sorted_vals)) - 1))
+    return sorted_vals[i]
+
+def summarize(samples, elapsed):
+    # samples = [(t_envoi, latence_ms ou None, clé d'erreur ou None)]
+    lat = sorted(ms for _t, ms, _e in samples if ms is not None)
+    total = len(samples)
+    errors = {}
+    for _t, _ms, err in samples:
+        if err is not None:
+            errors[err] = errors.get(err, 0) + 1
+    n_err = sum(errors.values())
+    return {
+        "requests": total,
+        "ok": total - n_err,
+        "errors": n_err,
+        "error_rate": round(n_err / total, 4) if total else 0.0,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 2) if elapsed > 0 else 0.0,
+        "latency_ms": {
+            "min": round(lat[0], 3) if lat else 0.0,
+            "mean": round(sum(lat) / len(lat), 3) if lat else 0.0,
+            "p50": round(percentile(lat, 50), 3),
+            "p90": round(percentile(lat, 90), 3),
+            "p95": round(percentile(lat, 95), 3),
+            "p99": round(percentile(lat, 99), 3),
+            "max": round(lat[-1], 3) if lat else 0.0,
+        },
+        "error_samples": dict(sorted(errors.items(), key=lambda kv: -kv[1])[:10]),
+    }
+
+# =========================
+# LOAD
+# =========================
+def run_load(url, sessions=10, rate=0.0, duration=10.0, ramp=0.0, timeout=8, modules=None):
+    modules = modules if modules is not None else {"system": True, "network": True}
+    lock = threading.Lock()
+    samples = []
+    # rate = cible globale (req/s), répartie sur les sessions ; 0 = sans limite
+    interval = (sessions / rate) if rate > 0 else 0.0
+
+    t0 = time.perf_counter()
+    t_end = t0 + ramp + duration
+
+    def worker(i):
+        sid = f"PC-{uuid.uuid4().hex[:8].upper()}"
+        start = t0 + (ramp * i / sessions if sessions else 0.0)
+        nxt = start
+        while True:
+            now = time.perf_counter()
+            if nxt > now:
+                time.sleep(nxt - now)
+            if time.perf_counter() >= t_end:
+                return
+            a = time.perf_counter()
+            try:
+                payload = build_snapshot_payload(sid, modules)
+                a = time.perf_counter()
+                ok, info = http_post_json(url, payload, timeout=timeout)
+                ms = (time.perf_counter() - a) * 1000.0
+            except Exception as e:
+                # une exception compte comme une erreur, la session continue
+                ok, info, ms = False, f"exception: {e!r}", None
+            with lock:
+                samples.append((a, ms, None if ok else str(info)[:120]))
+            nxt = max(nxt + interval, time.perf_counter()) if interval else time.perf_counter()
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(sessions)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # stats steady-state sur [t0 + ramp, t_end] (par heure d'envoi) ; le ramp-up est rapporté à part
+    t_steady = t0 + ramp
+    res = summarize([x for x in samples if x[0] >= t_steady], duration)
+    if ramp > 0:
+        res["ramp"] = summarize([x for x in samples if x[0] < t_steady], ramp)
+    res["config"] = {
+        "url": url, "sessions": sessions, "rate": rate, "duration_s": duration,
+        "ramp_s": ramp, "timeout_s": timeout, "modules": modules,
+    }
+    return res
+
+# =========================
+# RUN
+# =========================
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Simule N clients phantom_core concurrents contre un collecteur.")
+    ap.add_argument("--url", default=ENDPOINT_SESSION, help="endpoint /session (défaut: config.json)")
+    ap.add_argument("--health", default=None, help="endpoint /health vérifié avant le run")
+    ap.add_argument("--sessions", type=int, default=10, help="clients concurrents")
+    ap.add_argument("--rate", type=float, default=0.0, help="débit cible global en req/s (0 = max)")
+    ap.add_argument("--duration", type=float, default=10.0, help="durée en secondes (après ramp-up)")
+    ap.add_argument("--ramp", type=float, default=0.0, help="ramp-up en secondes")
+    ap.add_argument("--timeout", type=float, default=8, help="timeout HTTP par requête")
+    ap.add_argument("--modules", default="system,network", help="modules snapshot, ex: system,network ou ''")
+    ap.add_argument("--stub", action="store_true", help="démarre un collecteur local et vise celui-ci")
+    ap.add_argument("--serve", action="store_true", help="lance seulement le collecteur local et bloque (1re ligne stdout = URLs JSON)")
+    ap.add_argument("--port", type=int, default=0, help="port du collecteur local (0 = libre)")
+    ap.add_argument("--out", default=None, help="fichier JSON de sortie (défaut: stdout)")
+    a = ap.parse_args(argv)
+
+    if a.serve:
+        srv = start_stub(port=a.port)
+        health, url = stub_urls(srv)
+        print(json.dumps({"health": health, "session": url}), flush=True)
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+        srv.shutdown()
+        return 0
+
+    srv = None
+    url, health = a.url, a.health
+    if a.stub:
+        srv = start_stub(port=a.port)
+        health, url = stub_urls(srv)
+
+    if health:
+        ok, data = http_get_json(health, timeout=4)
+        if not (ok and isinstance(data, dict) and data.get("ok") is True):
+            print(f"Health FAIL ({data})", file=sys.stderr)
+            return 2
+
+    names = [m.strip() for m in a.modules.split(",") if m.strip()]
+    modules = {"system": "system" in names, "network": "network" in names}
+    try:
+        res = run_load(url, a.sessions, a.rate, a.duration, a.ramp, a.timeout, modules)
+    finally:
+        if srv:
+            srv.shutdown()
+
+    out = json.dumps(res, indent=2)
+    if a.out:
+        with open(a.out, "w", encoding="utf-8") as f:
+            f.write(out + "\n")
+    print(out)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
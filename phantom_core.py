@@ -21,7 +21,8 @@ DEFAULT_CFG = {
     "endpoint_session": "http://127.0.0.1:5050/session",
     "shared_secret": "PHANTOM_CORE_SECRET_2026_SECURE",
     "user_key_sha256": "",
-    "admin_key_sha256": ""
+    "admin_key_sha256": "",
+    "collector_timeout_s": 1.5
 }
 
 def load_cfg():
@@ -44,6 +45,7 @@ TOOL_NAME = CFG.get("tool_name", "PHANTOM CORE")
 ENDPOINT_HEALTH = CFG.get("endpoint_health")
 ENDPOINT_SESSION = CFG.get("endpoint_session")
 SHARED_SECRET = CFG.get("shared_secret", "")
+COLLECTOR_TIMEOUT = float(CFG.get("collector_timeout_s") or 1.5)
 
 def sha256_hex(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
@@ -51,6 +53,18 @@ def sha256_hex(s: str) -> str:
 USER_KEY_SHA = (CFG.get("user_key_sha256") or "").lower().strip()
 ADMIN_KEY_SHA = (CFG.get("admin_key_sha256") or "").lower().strip()
 
+def match_key(raw_key: str):
+    # None = key vide ; sinon "ADMIN" / "USER" / "INVALIDE"
+    k = (raw_key or "").strip()
+    if not k:
+        return None
+    ksha = sha256_hex(k).lower()
+    if ADMIN_KEY_SHA and ksha == ADMIN_KEY_SHA:
+        return "ADMIN"
+    if USER_KEY_SHA and ksha == USER_KEY_SHA:
+        return "USER"
+    return "INVALIDE"
+
 # =========================
 # THEME
 # =========================
@@ -74,18 +88,123 @@ def sign_payload(secret: str, ts: int, session_id: str) -> str:
     msg = f"{ts}:{session_id}".encode("utf-8")
     return hmac.new(secret.encode("utf-8"), msg, hashlib.sha256).hexdigest()
 
+# =========================
+# METRICS (in-process)
+# =========================
+# écriture = quelques ops sous lock ; tout le formatage se fait à la lecture (snapshot)
+MS_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+class Counter:
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, n=1):
+        with self._lock:
+            self.value += n
+
+    def snapshot(self):
+        return self.value
+
+class Gauge:
+    def __init__(self):
+        self.value = 0
+
+    def set(self, v):
+        self.value = v
+
+    def snapshot(self):
+        return self.value
+
+class Histogram:
+    def __init__(self, buckets=MS_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, v):
+        i = 0
+        for b in self.buckets:
+            if v <= b:
+                break
+            i += 1
+        with self._lock:
+            self.counts[i] += 1
+            self.count += 1
+            self.sum += v
+
+    def snapshot(self):
+        with self._lock:
+            counts = list(self.counts)
+            count, total = self.count, self.sum
+        labels = [f"<={b}" for b in self.buckets] + [f">{self.buckets[-1]}"]
+
+        def quantile(q):
+            # calculé sur la copie : count et counts restent cohérents
+            if not count:
+                return "—"
+            acc = 0
+            for label, c in zip(labels, counts):
+                acc += c
+                if acc >= q * count:
+                    return label
+            return labels[-1]
+
+        return {
+            "count": count,
+            "mean": round(total / count, 3) if count else 0.0,
+            "p50": quantile(0.50),
+            "p95": quantile(0.95),
+            "buckets": dict(zip(labels, counts)),
+        }
+
+class Metrics:
+    def __init__(self):
+        self._m = {}
+        self._lock = threading.Lock()
+
+    def _get(self, name, cls):
+        m = self._m.get(name)
+        if m is None:
+            with self._lock:
+                m = self._m.setdefault(name, cls())
+        return m
+
+    def counter(self, name):
+        return self._get(name, Counter)
+
+    def gauge(self, name):
+        return self._get(name, Gauge)
+
+    def histogram(self, name):
+        return self._get(name, Histogram)
+
+    def snapshot(self):
+        with self._lock:
+            items = sorted(self._m.items())
+        return {k: m.snapshot() for k, m in items}
+
+METRICS = Metrics()
+
 # =========================
 # HTTP
 # =========================
 def http_get_json(url, timeout=4):
+    t0 = time.perf_counter()
     try:
         with urllib.request.urlopen(url, timeout=timeout) as r:
             data = r.read().decode("utf-8", errors="ignore")
             return True, json.loads(data)
     except Exception as e:
+        METRICS.counter("http.get.errors").inc()
         return False, str(e)
+    finally:
+        METRICS.histogram("http.get.ms").observe((time.perf_counter() - t0) * 1000.0)
 
 def http_post_json(url, payload, timeout=7):
+    t0 = time.perf_counter()
     try:
         data = json.dumps(payload).encode("utf-8")
         req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
@@ -93,13 +212,17 @@ def http_post_json(url, payload, timeout=7):
             body = r.read().decode("utf-8", errors="ignore")
             return True, body
     except urllib.error.HTTPError as e:
+        METRICS.counter("http.post.errors").inc()
         try:
             body = e.read().decode("utf-8", errors="ignore")
         except:
             body = str(e)
         return False, f"HTTP {e.code}: {body}"
     except Exception as e:
+        METRICS.counter("http.post.errors").inc()
         return False, str(e)
+    finally:
+        METRICS.histogram("http.post.ms").observe((time.perf_counter() - t0) * 1000.0)
 
 # =========================
 # DATA (basic diagnostics)
@@ -128,6 +251,72 @@ def collect_network():
         "local_ip": get_local_ip()
     }
 
+# =========================
+# COLLECTORS (registry + threads)
+# =========================
+# clé = flag de `modules` ; chaque collector renvoie un dict fusionné dans le payload
+COLLECTORS = {
+    "system": collect_system,
+    "network": collect_network,
+}
+# collector -> thread encore bloqué après sa deadline ; on ne le relance pas tant qu'il tourne
+_STUCK = {}
+_STUCK_LOCK = threading.Lock()
+
+def register_collector(name: str, fn):
+    COLLECTORS[name] = fn
+
+def _timed_collect(name, fn, box):
+    t0 = time.perf_counter()
+    try:
+        res = fn()
+        if isinstance(res, dict):
+            box["data"] = res
+        else:
+            box["error"] = f"résultat invalide ({type(res).__name__}), dict attendu"
+    except Exception as e:
+        box["error"] = str(e)
+    finally:
+        # durée réelle, même si le résultat arrive après la deadline
+        box["ms"] = (time.perf_counter() - t0) * 1000.0
+        METRICS.histogram(f"collector.{name}.ms").observe(box["ms"])
+
+def run_collectors(modules: dict, timeout=None):
+    # un thread daemon par collector et par appel : un collector lent ne bloque ni les autres ni la sortie
+    timeout = COLLECTOR_TIMEOUT if timeout is None else timeout
+    t0 = time.perf_counter()
+    data, report, jobs = {}, {}, {}
+    for name, on in modules.items():
+        if not on or name not in COLLECTORS:
+            continue
+        with _STUCK_LOCK:
+            prev = _STUCK.get(name)
+            if prev is not None and prev.is_alive():
+                METRICS.counter(f"collector.{name}.skipped").inc()
+                report[name] = {"status": "skipped", "error": "run précédent toujours en cours"}
+                continue
+            _STUCK.pop(name, None)
+        box = {}
+        th = threading.Thread(target=_timed_collect, args=(name, COLLECTORS[name], box),
+                              name=f"collector-{name}", daemon=True)
+        th.start()
+        jobs[name] = (th, box)
+
+    for name, (th, box) in jobs.items():
+        th.join(max(0.0, t0 + timeout - time.perf_counter()))
+        if th.is_alive():
+            with _STUCK_LOCK:
+                _STUCK[name] = th
+            METRICS.counter(f"collector.{name}.timeout").inc()
+            report[name] = {"status": "timeout", "ms": round((time.perf_counter() - t0) * 1000.0, 2)}
+        elif "error" in box:
+            METRICS.counter(f"collector.{name}.error").inc()
+            report[name] = {"status": "error", "error": box["error"], "ms": round(box["ms"], 2)}
+        else:
+            data.update(box["data"])
+            report[name] = {"status": "ok", "ms": round(box["ms"], 2)}
+    return data, report
+
 def build_snapshot_payload(session_id: str, modules: dict):
     ts = int(time.time())
     payload = {
@@ -140,12 +329,84 @@ def build_snapshot_payload(session_id: str, modules: dict):
         "local_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "modules": modules
     }
-    if modules.get("system"):
-        payload.update(collect_system())
-    if modules.get("network"):
-        payload.update(collect_network())
+    data, report = run_collectors(modules)
+    payload.update(data)
+    payload["collectors"] = report
     return payload
 
+# =========================
+# ANIMATION CLOCK
+# =========================
+class AnimClock:
+    # une seule boucle after() pour toutes les anims ; un job par clé (add() remplace l'ancien)
+    def __init__(self, root, min_ms=10):
+        self.root = root
+        self.min_ms = min_ms
+        self.jobs = {}
+        self._after = None
+        self._in_tick = False
+        self._dirty = False
+
+    def add(self, key, fn):
+        # fn(now) -> délai en ms avant le prochain appel, ou None pour s'arrêter
+        self.jobs[key] = fn
+        if self._in_tick:
+            self._dirty = True
+            return
+        if self._after:
+            self.root.after_cancel(self._after)
+        self._after = self.root.after(0, self._tick)
+
+    def cancel(self, key):
+        self.jobs.pop(key, None)
+
+    def every(self, key, interval_ms, fn):
+        due = [0.0]
+        def job(now):
+            if now >= due[0]:
+                due[0] = now + interval_ms / 1000.0
+                fn()
+            return (due[0] - now) * 1000.0
+        self.add(key, job)
+
+    def tween(self, key, start, end, speed, apply):
+        # speed en px/ms, basé sur le temps réel (indépendant du rythme des ticks)
+        st = {"v": float(start), "t": time.perf_counter()}
+        def job(now):
+            step = speed * (now - st["t"]) * 1000.0
+            st["t"] = now
+            d = end - st["v"]
+            st["v"] = float(end) if abs(d) <= step else st["v"] + (step if d > 0 else -step)
+            apply(int(round(st["v"])))
+            return None if st["v"] == end else self.min_ms
+        self.add(key, job)
+
+    def _tick(self):
+        self._after = None
+        self._in_tick = True
+        self._dirty = False
+        now = time.perf_counter()
+        wait = None
+        try:
+            for key, fn in list(self.jobs.items()):
+                try:
+                    ms = fn(now)
+                except Exception:
+                    # comme un callback after() : Tk affiche la traceback, puis le job est retiré
+                    self.root.report_callback_exception(*sys.exc_info())
+                    ms = None
+                if ms is None:
+                    if self.jobs.get(key) is fn:
+                        del self.jobs[key]
+                else:
+                    wait = ms if wait is None else min(wait, ms)
+        finally:
+            self._in_tick = False
+        if self._dirty or wait is None:
+            wait = self.min_ms
+        if self.jobs:
+            self._after = self.root.after(max(self.min_ms, int(wait)), self._tick)
+
 # =========================
 # MATRIX RAIN (fast)
 # =========================
@@ -160,6 +421,8 @@ class MatrixBG(tk.Canvas):
         self.max_cols = 90
         self.max_len = 18
         self.fade_stipple = "gray25"
+        self.trail = 8
+        self.frame_no = 0
         self.bind("<Configure>", self._on_resize)
         self.bind("<Motion>", self._on_mouse)
 
@@ -181,14 +444,21 @@ class MatrixBG(tk.Canvas):
             cols.append([x, y, speed, length])
         self.columns = cols
 
+    def start(self, clock):
+        clock.every("rain", self.fps_ms, self.step)
+
     def step(self):
+        t0 = time.perf_counter()
         w = self.winfo_width()
         h = self.winfo_height()
         if w <= 0 or h <= 0:
-            self.after(self.fps_ms, self.step)
             return
 
-        self.create_rectangle(0, 0, w, h, fill=BG, outline="", stipple=self.fade_stipple)
+        # chaque frame a son tag ; on ne garde que les `trail` dernières (sinon le canvas grossit sans fin)
+        self.frame_no += 1
+        tag = f"f{self.frame_no}"
+        self.delete(f"f{self.frame_no - self.trail}")
+        self.create_rectangle(0, 0, w, h, fill=BG, outline="", stipple=self.fade_stipple, tags=tag)
 
         mx = self.mouse_x
         for i in range(len(self.columns)):
@@ -204,7 +474,7 @@ class MatrixBG(tk.Canvas):
                         fill = GREEN if dist < 200 else "#63ff63"
                     else:
                         fill = GREEN_DIM if dist < 220 else "#1d5a1d"
-                    self.create_text(x, yy, text=ch, fill=fill, font=self.font)
+                    self.create_text(x, yy, text=ch, fill=fill, font=self.font, tags=tag)
 
             y += speed * boost
             if y - length * 16 > h + 80:
@@ -214,7 +484,7 @@ class MatrixBG(tk.Canvas):
 
             self.columns[i] = [x, y, speed, length]
 
-        self.after(self.fps_ms, self.step)
+        METRICS.histogram("frame.ms").observe((time.perf_counter() - t0) * 1000.0)
 
 # =========================
 # Rounded helper
@@ -255,6 +525,51 @@ class LogsPage:
     def sync(self):
         pass
 
+class MetricsPage:
+    def __init__(self, app):
+        self.app = app
+        self.frame = tk.Frame(app.content, bg=BG)
+        self.canvas = tk.Canvas(self.frame, bg=BG, highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True)
+        self.refresh_ms = 1000
+        self._ticking = False
+
+        rounded_rect(self.canvas, 20, 20, 840, 590, r=18, fill=PANEL, outline=BORDER, width=1, stipple="gray25")
+        self.canvas.create_text(40, 48, anchor="w", text="Performance", fill=TXT, font=("Segoe UI", 14, "bold"))
+
+        self.box = tk.Text(self.frame, bg=BG, fg=GREEN, insertbackground=TXT, relief="flat", font=("Consolas", 10))
+        self.canvas.create_window(40, 84, anchor="nw", window=self.box, width=780, height=470)
+
+    def render(self):
+        self.box.delete("1.0", "end")
+        if not self.app.admin_ok:
+            self.box.insert("end", "Admin requis.\n")
+            return
+        snap = METRICS.snapshot()
+        ok = snap.get("snapshot.ok", 0)
+        fail = snap.get("snapshot.fail", 0)
+        rate = f"{ok * 100.0 / (ok + fail):.1f}%" if ok + fail else "—"
+        self.box.insert("end", f"Snapshot success: {rate} ({ok} ok / {fail} fail)\n")
+        self.box.insert("end", f"Threads actifs: {threading.active_count()}\n\n")
+        for name, v in snap.items():
+            if isinstance(v, dict):
+                self.box.insert("end", f"{name:22s} n={v['count']:<7d} mean={v['mean']:.2f}ms p50 {v['p50']} p95 {v['p95']}\n")
+            else:
+                self.box.insert("end", f"{name:22s} {v}\n")
+
+    def _tick(self):
+        if self.app.current != "metrics":
+            self._ticking = False
+            return
+        self.render()
+        self.app.root.after(self.refresh_ms, self._tick)
+
+    def sync(self):
+        # ne lit le registre que si la page est affichée
+        if self.app.current == "metrics" and not self._ticking:
+            self._ticking = True
+            self._tick()
+
 class HomePage:
     def __init__(self, app):
         self.app = app
@@ -322,13 +637,23 @@ class HomePage:
         c.itemconfigure(self.sid_txt, text=f"Session ID: {sid}")
         c.itemconfigure(self.last_txt, text=f"Dernier envoi: {self.last_send} | Résultat: {self.last_result}")
 
-        s = collect_system()
-        n = collect_network()
+        # aperçu = données du dernier snapshot (collectées hors du thread Tk), jamais de collecte ici
+        p = self.app.last_payload or {}
         self.preview.delete("1.0", "end")
         self.preview.insert("end", f"Session: {sid}\n")
-        self.preview.insert("end", f"System: {s['os']} | {s['arch']} | py {s['python']}\n")
-        self.preview.insert("end", f"User: {s['username']} | Host: {s['hostname']}\n")
-        self.preview.insert("end", f"Network: local {n['local_ip']}\n")
+        if not p:
+            self.preview.insert("end", "Aucun snapshot encore: lance un snapshot pour l'aperçu.\n")
+            return
+        g = lambda k: p.get(k, "—")
+        self.preview.insert("end", f"Snapshot: {g('local_time')} ({g('session_id')})\n")
+        if "os" in p:
+            self.preview.insert("end", f"System: {g('os')} | {g('arch')} | py {g('python')}\n")
+            self.preview.insert("end", f"User: {g('username')} | Host: {g('hostname')}\n")
+        if "local_ip" in p:
+            self.preview.insert("end", f"Network: local {g('local_ip')}\n")
+        rep = " | ".join(f"{k} {v['status']}" + (f" {v['ms']:g}ms" if "ms" in v else "")
+                         for k, v in p.get("collectors", {}).items())
+        self.preview.insert("end", f"Collectors: {rep or '—'}\n")
 
 class ToolsPage:
     def __init__(self, app):
@@ -337,14 +662,15 @@ class ToolsPage:
         self.canvas = tk.Canvas(self.frame, bg=BG, highlightthickness=0)
         self.canvas.pack(fill="both", expand=True)
         self.buttons = []
+        self.built_admin = None
+        self._build_chrome()
         self._build()
 
-    def _build(self):
+    def _build_chrome(self):
+        # décor statique : dessiné une seule fois, jamais effacé
         c = self.canvas
-        c.delete("all")
-
-        rounded_rect(c, 20, 20, 840, 590, r=18, fill=PANEL, outline=BORDER, width=1, stipple="gray25")
-        c.create_text(40, 48, anchor="w", text="Outils", fill=TXT, font=("Segoe UI", 14, "bold"))
+        rounded_rect(c, 20, 20, 840, 590, r=18, fill=PANEL, outline=BORDER, width=1, stipple="gray25", tags="chrome")
+        c.create_text(40, 48, anchor="w", text="Outils", fill=TXT, font=("Segoe UI", 14, "bold"), tags="chrome")
         self.hint = c.create_text(40, 78, anchor="w", text="OFFLINE: outils désactivés.", fill=MUTED, font=("Segoe UI", 10, "bold"))
 
         self.cb_sys = tk.Checkbutton(self.frame, text="System", variable=self.app.mod_system, bg=PANEL, fg=TXT, selectcolor=PANEL2)
@@ -352,6 +678,14 @@ class ToolsPage:
         c.create_window(680, 44, anchor="nw", window=self.cb_sys)
         c.create_window(760, 44, anchor="nw", window=self.cb_net)
 
+    def _build(self):
+        # seuls les boutons dépendent de l'état (admin) : reconstruits uniquement s'il change
+        if self.built_admin == self.app.admin_ok:
+            return
+        self.built_admin = self.app.admin_ok
+        c = self.canvas
+        c.delete("tools")
+
         base = [
             ("📌 Envoyer Snapshot", self.app.launch_snapshot),
             ("🩺 Health Check", self.app.connect),
@@ -386,7 +720,7 @@ class ToolsPage:
                           command=lambda f=fn: self.guard(f))
             b.bind("<Enter>", lambda e, bb=b: bb.configure(bg=CARD2, fg=GREEN))
             b.bind("<Leave>", lambda e, bb=b: bb.configure(bg=CARD, fg=TXT))
-            c.create_window(x, y, anchor="nw", window=b, width=bw, height=bh)
+            c.create_window(x, y, anchor="nw", window=b, width=bw, height=bh, tags="tools")
             self.buttons.append(b)
 
     def guard(self, fn):
@@ -396,6 +730,7 @@ class ToolsPage:
         fn()
 
     def sync(self):
+        self._build()
         if self.app.connected:
             self.canvas.itemconfigure(self.hint, text="ONLINE ✅", fill=GREEN)
             for b in self.buttons:
@@ -404,7 +739,6 @@ class ToolsPage:
             self.canvas.itemconfigure(self.hint, text="OFFLINE ❌", fill=MUTED)
             for b in self.buttons:
                 b.configure(state="disabled")
-        self._build()
 
     def copy_sid(self):
         sid = self.app.session_id or "—"
@@ -415,16 +749,19 @@ class ToolsPage:
     def export_report(self):
         sid = self.app.session_id or f"PC-{uuid.uuid4().hex[:8].upper()}"
         path = os.path.join(BASE_DIR, f"report_{sid}.txt")
-        s = collect_system()
-        n = collect_network()
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(f"{TOOL_NAME} REPORT\nTime: {datetime.now()}\nSession: {sid}\n\n")
-            for k, v in s.items():
-                f.write(f"{k}: {v}\n")
-            f.write("\n")
-            for k, v in n.items():
-                f.write(f"{k}: {v}\n")
-        self.app.log(f"Report exporté -> {path}")
+        modules = self.app.current_modules()
+
+        def job():
+            data, report = run_collectors(modules)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(f"{TOOL_NAME} REPORT\nTime: {datetime.now()}\nSession: {sid}\n\n")
+                for k, v in data.items():
+                    f.write(f"{k}: {v}\n")
+                f.write("\n")
+                for k, v in report.items():
+                    f.write(f"collector {k}: {v}\n")
+            return f"Report exporté -> {path}"
+        self.app.run_bg(job)
 
     def open_folder(self):
         try:
@@ -434,12 +771,16 @@ class ToolsPage:
 
     def admin_export_json(self):
         sid = self.app.session_id or f"PC-{uuid.uuid4().hex[:8].upper()}"
-        modules = {"system": bool(self.app.mod_system.get()), "network": bool(self.app.mod_network.get())}
-        p = build_snapshot_payload(sid, modules)
+        modules = self.app.current_modules()
         path = os.path.join(BASE_DIR, f"payload_{sid}.json")
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(p, f, indent=2)
-        self.app.log(f"Export JSON -> {path}")
+
+        def job():
+            p = build_snapshot_payload(sid, modules)
+            p["metrics"] = METRICS.snapshot()
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(p, f, indent=2)
+            return f"Export JSON -> {path}"
+        self.app.run_bg(job)
 
 class KeyPage:
     def __init__(self, app):
@@ -503,9 +844,10 @@ class App:
         self.root.configure(bg=BG)
         self.root.resizable(False, False)
 
+        self.clock = AnimClock(self.root)
         self.bg = MatrixBG(self.root)
         self.bg.place(x=0, y=0, relwidth=1, relheight=1)
-        self.bg.step()
+        self.bg.start(self.clock)
 
         self.overlay = tk.Frame(self.root, bg=BG)
         self.overlay.place(x=0, y=0, relwidth=1, relheight=1)
@@ -514,6 +856,7 @@ class App:
         self.connected = False
         self.launching = False
         self.session_id = None
+        self.last_payload = None
         self.key_ok = False
         self.admin_ok = False
         self.mod_system = tk.BooleanVar(value=True)
@@ -595,19 +938,10 @@ class App:
         self.nav_items.append((key, ind, ico, lbl))
 
     def _side_anim(self, open_):
+        # même clé "side" : un Enter/Leave remplace l'anim en cours au lieu de la doubler
         target = self.side_w_open if open_ else self.side_w_closed
-        cur = self.side.winfo_width()
-        step = 16 if target > cur else -16
-
-        def tick():
-            nonlocal cur
-            cur += step
-            if (step > 0 and cur >= target) or (step < 0 and cur <= target):
-                cur = target
-            self.side.configure(width=cur)
-            if cur != target:
-                self.root.after(10, tick)
-        tick()
+        self.clock.tween("side", self.side.winfo_width(), target, 1.6,
+                         lambda w: self.side.configure(width=w))
 
     def show_page(self, key):
         self.current = key
@@ -638,6 +972,13 @@ class App:
         self.pages["logs"].frame.place(x=0, y=0, relwidth=1, relheight=1)
         self._nav_btn("📜", "Logs", "logs")
 
+    def ensure_metrics_page(self):
+        if "metrics" in self.pages:
+            return
+        self.pages["metrics"] = MetricsPage(self)
+        self.pages["metrics"].frame.place(x=0, y=0, relwidth=1, relheight=1)
+        self._nav_btn("📈", "Perf", "metrics")
+
     def log(self, msg):
         ts = datetime.now().strftime("%H:%M:%S")
         line = f"[{ts}] {msg}"
@@ -679,14 +1020,35 @@ class App:
         self.log("Snapshot: envoi en cours…")
         self.update_ui()
 
-        modules = {"system": bool(self.mod_system.get()), "network": bool(self.mod_network.get())}
-        payload = build_snapshot_payload(self.session_id, modules)
+        modules = self.current_modules()
+        sid = self.session_id
 
         def worker():
-            ok, info = http_post_json(ENDPOINT_SESSION, payload, timeout=8)
-            self.queue.put(("sent", ok, info))
+            # collecte (jusqu'à COLLECTOR_TIMEOUT) hors du thread Tk ; toujours une réponse dans la queue
+            payload = None
+            try:
+                payload = build_snapshot_payload(sid, modules)
+                ok, info = http_post_json(ENDPOINT_SESSION, payload, timeout=8)
+            except Exception as e:
+                ok, info = False, str(e)
+            self.queue.put(("sent", ok, info, payload))
 
         threading.Thread(target=worker, daemon=True).start()
+        METRICS.counter("snapshot.launched").inc()
+
+    def current_modules(self):
+        # lu sur le thread Tk (BooleanVar), passé tel quel aux workers
+        return {"system": bool(self.mod_system.get()), "network": bool(self.mod_network.get())}
+
+    def run_bg(self, job):
+        # job() tourne hors du thread Tk ; son message (ou l'erreur) revient par la queue
+        def worker():
+            try:
+                msg = job()
+            except Exception as e:
+                msg = f"FAIL ❌ ({e})"
+            self.queue.put(("log", msg))
+        threading.Thread(target=worker, daemon=True).start()
 
     def stop(self):
         self.launching = False
@@ -694,23 +1056,22 @@ class App:
         self.update_ui()
 
     def validate_key(self, raw_key: str):
-        global USER_KEY_SHA, ADMIN_KEY_SHA
-        k = (raw_key or "").strip()
-        if not k:
+        lvl = match_key(raw_key)
+        if lvl is None:
             self.key_ok = False
             self.admin_ok = False
             self.update_ui()
             return False, "Key vide"
 
-        ksha = sha256_hex(k).lower()
-        if ADMIN_KEY_SHA and ksha == ADMIN_KEY_SHA:
+        if lvl == "ADMIN":
             self.key_ok = True
             self.admin_ok = True
             self.ensure_logs_page()
+            self.ensure_metrics_page()
             self.log("Admin key validée ✅")
             self.update_ui()
             return True, "ADMIN"
-        if USER_KEY_SHA and ksha == USER_KEY_SHA:
+        if lvl == "USER":
             self.key_ok = True
             self.admin_ok = False
             self.ensure_logs_page()
@@ -744,12 +1105,19 @@ class App:
         return True, "Admin key enregistrée ✅"
 
     def _poll(self):
+        METRICS.gauge("poll.queue_depth").set(self.queue.qsize())
+        METRICS.gauge("threads.active").set(threading.active_count())
         try:
             while True:
                 item = self.queue.get_nowait()
-                if item[0] == "sent":
-                    ok, info = item[1], item[2]
+                if item[0] == "log":
+                    self.log(item[1])
+                elif item[0] == "sent":
+                    ok, info, payload = item[1], item[2], item[3]
+                    if payload is not None:
+                        self.last_payload = payload
                     self.launching = False
+                    METRICS.counter("snapshot.ok" if ok else "snapshot.fail").inc()
                     if ok:
                         self.log("Snapshot: OK ✅")
                         self.pages["home"].last_send = datetime.now().strftime("%H:%M:%S")
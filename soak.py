@@ -0,0 +1,232 @@
+import os, sys, json, time, shutil, argparse, threading, subprocess, statistics
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+import phantom_core as pc
+from loadgen import start_stub_process
+
+# =========================
+# VIRTUAL DISPLAY
+# =========================
+def start_xvfb(display=None, size="1280x800x24"):
+    if not shutil.which("Xvfb"):
+        raise RuntimeError("Xvfb introuvable (apt install xvfb)")
+    n = display
+    if n is None:
+        n = 99
+        while os.path.exists(f"/tmp/.X11-unix/X{n}") or os.path.exists(f"/tmp/.X{n}-lock"):
+            n += 1
+    proc = subprocess.Popen(["Xvfb", f":{n}", "-screen", "0", size, "-nolisten", "tcp"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 5
+    while not os.path.exists(f"/tmp/.X11-unix/X{n}"):
+        if proc.poll() is not None or time.time() > deadline:
+            proc.kill()
+            raise RuntimeError(f"Xvfb :{n} n'a pas démarré")
+        time.sleep(0.05)
+    os.environ["DISPLAY"] = f":{n}"
+    return proc
+
+# =========================
+# PROBES
+# =========================
+def rss_bytes():
+    if psutil:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        return 0
+
+def canvas_items(app):
+    canvases = [app.bg] + [p.canvas for p in app.pages.values()]
+    return sum(len(c.find_all()) for c in canvases)
+
+def widget_count(w):
+    return 1 + sum(widget_count(ch) for ch in w.winfo_children())
+
+def log_lines(app):
+    if "logs" not in app.pages:
+        return 0
+    return int(app.pages["logs"].box.index("end-1c").split(".")[0])
+
+# =========================
+# SOAK
+# =========================
+USER_KEY = "SOAK-USER-KEY"
+ADMIN_KEY = "SOAK-ADMIN-KEY"
+
+# metric -> pente max tolérée (unités / minute, moindres carrés après warmup) ; indépendant de la durée
+DEFAULT_LIMITS = {
+    "canvas_items": 30.0,
+    "rss_mb": 2.0,
+    "threads": 0.5,
+    "widgets": 5.0,
+    "log_lines": 10.0,
+    "loop_lag_ms_p95": 5.0,
+}
+MIN_SPAN_S = 60.0
+
+def slope_per_min(ts, ys):
+    n = len(ts)
+    mt, my = sum(ts) / n, sum(ys) / n
+    var = sum((t - mt) ** 2 for t in ts)
+    if not var:
+        return 0.0
+    return sum((t - mt) * (y - my) for t, y in zip(ts, ys)) / var * 60.0
+
+class Soak:
+    def __init__(self, app, duration=60.0, sample_every=1.0, action_every=0.25, warmup=5.0, probe_ms=50):
+        self.app = app
+        self.root = app.root
+        self.duration = duration
+        self.sample_every = sample_every
+        self.action_every = action_every
+        self.warmup = warmup
+        self.probe_ms = probe_ms
+        self.samples = []
+        self.lags = []
+        self.actions_done = 0
+        self.errors = []
+        self.t0 = None
+        self.script = self._script()
+
+    def _script(self):
+        app = self.app
+
+        def validate(raw):
+            kp = app.pages["key"]
+            kp.entry.delete(0, "end")
+            kp.entry.insert(0, raw)
+            kp.btn_validate.invoke()
+
+        def nav(key):
+            # clic réel sur l'item de nav (si présent), sinon show_page
+            for kk, _ind, ico, _lbl in app.nav_items:
+                if kk == key:
+                    ico.event_generate("<Button-1>")
+                    return
+            app.show_page(key)
+
+        return [
+            lambda: app.pages["home"].btn_connect.invoke(),
+            lambda: app.pages["home"].btn_launch.invoke(),
+            lambda: nav("tools"),
+            lambda: validate(USER_KEY),
+            lambda: nav("logs"),
+            lambda: app.launch_snapshot(),
+            lambda: validate(ADMIN_KEY),
+            lambda: nav("tools"),
+            lambda: validate("nope"),
+            lambda: nav("key"),
+            lambda: app.new_session(),
+            lambda: nav("home"),
+            lambda: app.side.event_generate("<Enter>"),
+            lambda: app.side.event_generate("<Leave>"),
+            lambda: app.pages["home"].btn_disconnect.invoke(),
+        ]
+
+    def start(self):
+        self.t0 = time.perf_counter()
+        self.root.after(self.probe_ms, self._probe, time.perf_counter())
+        self.root.after(int(self.action_every * 1000), self._act)
+        self.root.after(int(self.sample_every * 1000), self._sample)
+        self.root.after(int(self.duration * 1000), self.root.quit)
+
+    def _probe(self, scheduled):
+        lag = (time.perf_counter() - scheduled) * 1000.0 - self.probe_ms
+        self.lags.append(max(0.0, lag))
+        self.root.after(self.probe_ms, self._probe, time.perf_counter())
+
+    def _act(self):
+        fn = self.script[self.actions_done % len(self.script)]
+        try:
+            fn()
+        except Exception as e:
+            self.errors.append(f"action {self.actions_done % len(self.script)}: {e!r}")
+        self.actions_done += 1
+        self.root.after(int(self.action_every * 1000), self._act)
+
+    def _sample(self):
+        lags = sorted(self.lags)
+        self.lags = []
+        p95 = lags[min(len(lags) - 1, int(len(lags) * 0.95))] if lags else 0.0
+        self.samples.append({
+            "t": round(time.perf_counter() - self.t0, 3),
+            "canvas_items": canvas_items(self.app),
+            "rss_mb": round(rss_bytes() / (1024 * 1024), 2),
+            "threads": threading.active_count(),
+            "widgets": widget_count(self.root),
+            "log_lines": log_lines(self.app),
+            "loop_lag_ms_p95": round(p95, 2),
+            "actions": self.actions_done,
+        })
+        self.root.after(int(self.sample_every * 1000), self._sample)
+
+    def verdict(self, limits=None):
+        limits = limits or DEFAULT_LIMITS
+        s = [x for x in self.samples if x["t"] >= self.warmup]
+        out = {}
+        if len(s) < 6 or s[-1]["t"] - s[0]["t"] < MIN_SPAN_S:
+            return False, {"error": f"fenêtre trop courte après warmup (min {MIN_SPAN_S:g}s)"}
+        ts = [x["t"] for x in s]
+        ok_all = True
+        for m, max_slope in limits.items():
+            ys = [x[m] for x in s]
+            slope = slope_per_min(ts, ys)
+            ok = slope <= max_slope
+            ok_all = ok_all and ok
+            out[m] = {"first": ys[0], "last": ys[-1], "median": statistics.median(ys),
+                      "slope_per_min": round(slope, 3), "max_slope_per_min": max_slope, "ok": ok}
+        return ok_all, out
+
+# =========================
+# RUN
+# =========================
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Soak test headless de l'App Tk (Xvfb).")
+    ap.add_argument("--duration", type=float, default=300.0, help="durée totale (s)")
+    ap.add_argument("--warmup", type=float, default=10.0, help="échantillons ignorés au début (s)")
+    ap.add_argument("--sample-every", type=float, default=1.0)
+    ap.add_argument("--action-every", type=float, default=0.25)
+    ap.add_argument("--no-xvfb", action="store_true", help="utilise le DISPLAY courant")
+    ap.add_argument("--out", default=None, help="rapport JSON (défaut: stdout)")
+    a = ap.parse_args(argv)
+
+    # stub hors process : ses threads/mémoire ne comptent pas dans les métriques surveillées
+    stub, health, session = start_stub_process()
+    xvfb = None
+    try:
+        xvfb = None if a.no_xvfb else start_xvfb()
+        pc.ENDPOINT_HEALTH, pc.ENDPOINT_SESSION = health, session
+        # clés de test en mémoire uniquement (pas de save_cfg)
+        pc.USER_KEY_SHA = pc.sha256_hex(USER_KEY).lower()
+        pc.ADMIN_KEY_SHA = pc.sha256_hex(ADMIN_KEY).lower()
+
+        app = pc.App()
+        soak = Soak(app, a.duration, a.sample_every, a.action_every, a.warmup)
+        soak.start()
+        app.root.mainloop()
+        ok, verdict = soak.verdict()
+        app.root.destroy()
+    finally:
+        stub.terminate()
+        stub.wait(5)
+        if xvfb:
+            xvfb.terminate()
+
+    report = {"ok": ok and not soak.errors, "verdict": verdict, "errors": soak.errors[:50],
+              "actions": soak.actions_done, "samples": soak.samples}
+    out = json.dumps(report, indent=2)
+    if a.out:
+        with open(a.out, "w", encoding="utf-8") as f:
+            f.write(out + "\n")
+    print(json.dumps({"ok": report["ok"], "verdict": verdict}, indent=2) if a.out else out)
+    return 0 if report["ok"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())